@@ -0,0 +1,36 @@
+import importlib
+import os
+
+from .base import Backend
+
+__all__ = ["Backend", "get_backend", "BACKENDS", "BACKEND_ENV_VAR", "DEFAULT_BACKEND"]
+
+# backend modules are imported only on first use, so loading graphs does not
+# initialize pygraphblas
+BACKENDS = {
+    "pygraphblas": "project.backends.pygraphblas_backend",
+    "scipy": "project.backends.scipy_backend",
+}
+BACKEND_ENV_VAR = "GRAPH_ANALYSIS_BACKEND"
+DEFAULT_BACKEND = "pygraphblas"
+
+_loaded = {}
+
+
+def get_backend(backend=None) -> Backend:
+    """
+    Get backend of sparse matrix operations
+
+    @param backend: backend object, its name or None to take name from environment variable
+    @return: backend object
+    """
+    if isinstance(backend, Backend):
+        return backend
+
+    name = backend or os.getenv(BACKEND_ENV_VAR) or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}")
+
+    if name not in _loaded:
+        _loaded[name] = importlib.import_module(BACKENDS[name]).backend
+    return _loaded[name]
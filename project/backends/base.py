@@ -0,0 +1,234 @@
+from abc import ABC, abstractmethod
+
+__all__ = ["Backend"]
+
+
+class Backend(ABC):
+    """
+    Sparse matrix operations used by graph algorithms
+
+    Operations never modify their arguments and always return new objects.
+    Semirings are named as "<add>_<multiply>" like "min_plus" or "lor_land",
+    binary operations are named as "min", "plus", "first" and so on.
+    Masks are structural: only positions of stored elements matter.
+    Element types are given as numpy types (np.bool_, np.int32, np.float64).
+    """
+
+    name: str = None
+
+    @abstractmethod
+    def matrix(self, nrows: int, ncols: int, dtype, rows=(), cols=(), values=()):
+        """
+        Build matrix from coordinates of its elements
+
+        @param nrows: count of rows
+        @param ncols: count of columns
+        @param dtype: numpy type of elements
+        @param rows: row indexes of elements
+        @param cols: column indexes of elements
+        @param values: values of elements
+        @return: matrix without duplicate elements
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def vector(self, size: int, dtype, indices=(), values=()):
+        """
+        Build vector from indexes of its elements
+
+        @param size: size of vector
+        @param dtype: numpy type of elements
+        @param indices: indexes of elements
+        @param values: values of elements
+        @return: vector without duplicate elements
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def shape(self, a) -> tuple[int, int]:
+        """
+        @param a: matrix
+        @return: count of rows and count of columns
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def nvals(self, a) -> int:
+        """
+        @param a: matrix or vector
+        @return: count of stored elements
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def mxm(self, a, b, semiring: str, mask=None, complement: bool = False):
+        """
+        Multiply matrices over semiring
+
+        @param a: left matrix, its type is type of result
+        @param b: right matrix
+        @param semiring: name of semiring
+        @param mask: matrix, only its positions are computed
+        @param complement: compute only positions which are not in mask
+        @return: product matrix
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def vxm(self, v, a, semiring: str, mask=None, complement: bool = False):
+        """
+        Multiply vector by matrix over semiring
+
+        @param v: vector, its type is type of result
+        @param a: matrix
+        @param semiring: name of semiring
+        @param mask: vector, only its positions are computed
+        @param complement: compute only positions which are not in mask
+        @return: product vector
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def eadd(self, a, b, op: str):
+        """
+        Element-wise addition on union of structures
+
+        @param a: matrix or vector
+        @param b: matrix or vector with the same shape
+        @param op: binary operation for positions present in both
+        @return: matrix or vector
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply(self, a, op: str):
+        """
+        Apply index unary operation ("positioni" or "positionj") to each element
+
+        @param a: matrix
+        @param op: name of operation
+        @return: matrix with the same structure
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def select(self, a, op: str, thunk):
+        """
+        Keep elements which satisfy comparison with scalar
+
+        @param a: matrix or vector
+        @param op: comparison ("<", "<=", ">", ">=", "==" or "!=")
+        @param thunk: scalar to compare values with
+        @return: matrix or vector with selected elements
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def assign_scalar(self, a, value, mask, complement: bool = False):
+        """
+        Set value to positions of mask
+
+        @param a: matrix or vector
+        @param value: scalar to set
+        @param mask: matrix or vector with the same shape
+        @param complement: set value to positions which are not in mask
+        @return: matrix or vector
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reduce(self, a):
+        """
+        @param a: matrix
+        @return: sum of all elements
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reduce_vector(self, a):
+        """
+        @param a: matrix
+        @return: vector of sums of rows, rows without elements are not stored
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def tril(self, a):
+        """
+        @param a: matrix
+        @return: lower triangle with main diagonal
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def triu(self, a):
+        """
+        @param a: matrix
+        @return: upper triangle with main diagonal
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def extract_row(self, a, index: int):
+        """
+        @param a: matrix
+        @param index: index of row
+        @return: matrix with one row
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def extract_column(self, a, index: int):
+        """
+        @param a: matrix
+        @param index: index of column
+        @return: matrix with one column
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iseq(self, a, b) -> bool:
+        """
+        @param a: matrix
+        @param b: matrix
+        @return: True if matrices have the same structure and values
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def to_arrays(self, a):
+        """
+        Export elements of matrix, arrays may share memory with exported buffers
+
+        @param a: matrix
+        @return: numpy arrays of row indexes, column indexes and values
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def vector_to_arrays(self, v):
+        """
+        Export elements of vector, arrays may share memory with exported buffers
+
+        @param v: vector
+        @return: numpy arrays of indexes and values
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def to_dense(self, a, fill=0):
+        """
+        @param a: matrix
+        @param fill: value of positions without elements
+        @return: numpy array
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def vector_to_dense(self, v, fill=0):
+        """
+        @param v: vector
+        @param fill: value of positions without elements
+        @return: one-dimensional numpy array
+        """
+        raise NotImplementedError
@@ -0,0 +1,181 @@
+import numpy as np
+import pygraphblas as pgb
+from pygraphblas import Matrix, Vector, types
+from suitesparse_graphblas import ffi, lib
+
+from .base import Backend
+
+__all__ = ["PygraphblasBackend", "backend"]
+
+_TYPES = {
+    np.dtype(np.bool_): types.BOOL,
+    np.dtype(np.int32): types.INT32,
+    np.dtype(np.int64): types.INT64,
+    np.dtype(np.float64): types.FP64,
+}
+_DTYPES = {typ: dtype for dtype, typ in _TYPES.items()}
+
+
+def _check(result):
+    if result != lib.GrB_SUCCESS:
+        raise RuntimeError(f"GraphBLAS call failed with code {result}")
+
+
+# pygraphblas Matrix.from_lists accepts only non-empty lists of Python ints and
+# Matrix.to_arrays fills array.array one Python int at a time, so elements are
+# moved with GrB_*_build and GrB_*_extractTuples over numpy buffers. These two
+# functions are the only place touching private pygraphblas attributes.
+
+
+def _build(result, indices, values):
+    """
+    Fill empty matrix or vector with elements
+
+    @param result: empty pygraphblas matrix or vector
+    @param indices: row and column index arrays for matrix, index array for vector
+    @param values: array of values
+    @return: given matrix or vector
+    """
+    if len(values) == 0:
+        return result
+
+    typ = result.type
+    kind, handle = (
+        ("Matrix", result._matrix[0])
+        if isinstance(result, Matrix)
+        else ("Vector", result._vector[0])
+    )
+    values = np.ascontiguousarray(values, dtype=_DTYPES[typ])
+    indices = [np.ascontiguousarray(array, dtype=np.uint64) for array in indices]
+    _check(
+        getattr(lib, f"GrB_{kind}_build_{typ._base_name}")(
+            handle,
+            *(ffi.from_buffer("GrB_Index[]", array) for array in indices),
+            ffi.from_buffer(f"{typ._c_type}[]", values),
+            len(values),
+            getattr(lib, f"GrB_SECOND_{typ._base_name}"),
+        )
+    )
+    return result
+
+
+def _extract(a):
+    """
+    Export elements of matrix or vector into numpy arrays sharing memory with cffi buffers
+
+    @param a: pygraphblas matrix or vector
+    @return: index arrays (rows and columns or indices) followed by values array
+    """
+    typ = a.type
+    nvals = ffi.new("GrB_Index[1]", [a.nvals])
+    if isinstance(a, Matrix):
+        indices = [ffi.new(f"GrB_Index[{a.nvals}]") for _ in range(2)]
+        extract, handle = typ._Matrix_extractTuples, a._matrix[0]
+    else:
+        indices = [ffi.new(f"GrB_Index[{a.nvals}]")]
+        extract, handle = typ._Vector_extractTuples, a._vector[0]
+    values = ffi.new(f"{typ._c_type}[{a.nvals}]")
+    _check(extract(*indices, values, nvals, handle))
+    return (
+        *(np.frombuffer(ffi.buffer(array), dtype=np.uint64) for array in indices),
+        np.frombuffer(ffi.buffer(values), dtype=_DTYPES[typ]),
+    )
+
+
+# structural complemented mask without replace, combining S & C at runtime needs
+# descriptor fields missing in newer SuiteSparse builds
+_STRUCTURE_COMPLEMENT = pgb.descriptor.Descriptor(lib.GrB_DESC_SC, name="SC")
+
+
+def _desc(complement: bool):
+    if complement:
+        return _STRUCTURE_COMPLEMENT
+    return pgb.descriptor.S
+
+
+class PygraphblasBackend(Backend):
+    name = "pygraphblas"
+
+    def matrix(self, nrows: int, ncols: int, dtype, rows=(), cols=(), values=()):
+        result = Matrix.sparse(_TYPES[np.dtype(dtype)], nrows, ncols)
+        return _build(result, (rows, cols), values)
+
+    def vector(self, size: int, dtype, indices=(), values=()):
+        result = Vector.sparse(_TYPES[np.dtype(dtype)], size)
+        return _build(result, (indices,), values)
+
+    def shape(self, a) -> tuple[int, int]:
+        return a.nrows, a.ncols
+
+    def nvals(self, a) -> int:
+        return a.nvals
+
+    def mxm(self, a, b, semiring: str, mask=None, complement: bool = False):
+        semiring = getattr(a.type, semiring.upper())
+        if mask is None:
+            return a.mxm(b, semiring=semiring)
+        return a.mxm(b, semiring=semiring, mask=mask, desc=_desc(complement))
+
+    def vxm(self, v, a, semiring: str, mask=None, complement: bool = False):
+        semiring = getattr(v.type, semiring.upper())
+        # without out pygraphblas looks for T1 in descriptor, see _STRUCTURE_COMPLEMENT
+        out = Vector.sparse(v.type, a.ncols)
+        if mask is None:
+            return v.vxm(a, out=out, semiring=semiring)
+        return v.vxm(a, out=out, semiring=semiring, mask=mask, desc=_desc(complement))
+
+    def eadd(self, a, b, op: str):
+        return a.eadd(b, add_op=getattr(a.type, op.upper()))
+
+    def apply(self, a, op: str):
+        return a.apply(getattr(a.type, op.upper()))
+
+    def select(self, a, op: str, thunk):
+        return a.select(op, thunk)
+
+    def assign_scalar(self, a, value, mask, complement: bool = False):
+        result = a.dup()
+        result.assign_scalar(value, mask=mask, desc=_desc(complement))
+        return result
+
+    def reduce(self, a):
+        return a.reduce()
+
+    def reduce_vector(self, a):
+        return a.reduce_vector()
+
+    def tril(self, a):
+        return a.tril()
+
+    def triu(self, a):
+        return a.triu()
+
+    def extract_row(self, a, index: int):
+        return a.extract_matrix(row_index=index)
+
+    def extract_column(self, a, index: int):
+        return a.extract_matrix(col_index=index)
+
+    def iseq(self, a, b) -> bool:
+        return a.iseq(b)
+
+    def to_arrays(self, a):
+        return _extract(a)
+
+    def vector_to_arrays(self, v):
+        return _extract(v)
+
+    def to_dense(self, a, fill=0):
+        rows, cols, values = self.to_arrays(a)
+        result = np.full((a.nrows, a.ncols), fill, dtype=np.result_type(values, fill))
+        result[rows, cols] = values
+        return result
+
+    def vector_to_dense(self, v, fill=0):
+        indices, values = self.vector_to_arrays(v)
+        result = np.full(v.size, fill, dtype=np.result_type(values, fill))
+        result[indices] = values
+        return result
+
+
+backend = PygraphblasBackend()
@@ -0,0 +1,296 @@
+import numpy as np
+import scipy.sparse as sp
+
+from .base import Backend
+
+__all__ = ["ScipyBackend", "backend"]
+
+# Matrices are csr_matrix without duplicates, vectors are csr_matrix with one row.
+# Stored zeros are elements: scipy arithmetic treats missing elements as zeros
+# and may drop stored ones, so all operations work on coordinates directly.
+
+_ADD_OPS = {
+    "plus": np.add,
+    "minus": np.subtract,
+    "times": np.multiply,
+    "min": np.minimum,
+    "max": np.maximum,
+    "lor": np.logical_or,
+    "land": np.logical_and,
+}
+
+_MULTIPLY_OPS = {
+    "plus": np.add,
+    "minus": np.subtract,
+    "times": np.multiply,
+    "min": np.minimum,
+    "max": np.maximum,
+    "land": np.logical_and,
+    "first": lambda left, right: left,
+    "second": lambda left, right: right,
+    "pair": lambda left, right: np.ones_like(left),
+}
+
+_SELECT_OPS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+def _coo(a):
+    a = a.tocoo()
+    return a.row.astype(np.int64), a.col.astype(np.int64), a.data
+
+
+def _keys(rows, cols, ncols: int):
+    return rows * ncols + cols
+
+
+def _build(rows, cols, values, shape, dtype):
+    return sp.csr_matrix(
+        (np.asarray(values, dtype=dtype), (rows, cols)), shape=shape, dtype=dtype
+    )
+
+
+def _combine(rows, cols, values, shape, op: str, dtype):
+    """
+    Build matrix from elements with duplicates
+
+    @param rows: row indexes of elements
+    @param cols: column indexes of elements
+    @param values: values of elements
+    @param shape: shape of matrix
+    @param op: binary operation to combine duplicates, "first" and "second" keep one of them
+    @param dtype: numpy type of elements
+    @return: matrix
+    """
+    keys = _keys(rows, cols, shape[1])
+    order = np.argsort(keys, kind="stable")
+    keys, values = keys[order], values[order]
+    unique, starts = np.unique(keys, return_index=True)
+
+    if len(unique) == 0:
+        combined = values
+    elif op == "first":
+        combined = values[starts]
+    elif op == "second":
+        combined = values[np.append(starts[1:], len(keys)) - 1]
+    else:
+        combined = _ADD_OPS[op].reduceat(values, starts)
+
+    rows, cols = np.divmod(unique, shape[1])
+    return _build(rows, cols, combined, shape, dtype)
+
+
+def _pattern(a):
+    """
+    Matrix with the same structure as given one and ones as values
+    """
+    a = a.tocsr()
+    ones = np.ones(len(a.data), dtype=a.dtype)
+    return sp.csr_matrix((ones, a.indices, a.indptr), shape=a.shape)
+
+
+def _spgemm_exact(a, b, multiply: str) -> bool:
+    """
+    Check that scipy product gives the same structure as plus semiring
+
+    scipy drops zero sums, they can appear only from stored zeros or signed values.
+    """
+    if multiply == "pair":
+        return True
+    if multiply != "times" or a.dtype == np.bool_:
+        return False
+    return bool((a.data > 0).all() and (b.data > 0).all())
+
+
+def _in_mask(rows, cols, mask, complement: bool):
+    mask_rows, mask_cols, _ = _coo(mask)
+    ncols = mask.shape[1]
+    selected = np.isin(_keys(rows, cols, ncols), _keys(mask_rows, mask_cols, ncols))
+    return ~selected if complement else selected
+
+
+class ScipyBackend(Backend):
+    name = "scipy"
+
+    def matrix(self, nrows: int, ncols: int, dtype, rows=(), cols=(), values=()):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=dtype)
+        return _combine(rows, cols, values, (nrows, ncols), "second", dtype)
+
+    def vector(self, size: int, dtype, indices=(), values=()):
+        indices = np.asarray(indices, dtype=np.int64)
+        return self.matrix(1, size, dtype, np.zeros_like(indices), indices, values)
+
+    def shape(self, a) -> tuple[int, int]:
+        return a.shape
+
+    def nvals(self, a) -> int:
+        return a.nnz
+
+    def mxm(self, a, b, semiring: str, mask=None, complement: bool = False):
+        add, multiply = semiring.split("_")
+        shape = (a.shape[0], b.shape[1])
+        if add == "plus" and not complement and _spgemm_exact(a, b, multiply):
+            # scipy SpGEMM allocates only the product, not every a[i, k] * b[k, j]
+            if multiply == "pair":
+                a, b = _pattern(a), _pattern(b)
+            rows, cols, values = _coo(a.tocsr() @ b.tocsr())
+            if mask is not None:
+                selected = _in_mask(rows, cols, mask, complement)
+                rows, cols, values = rows[selected], cols[selected], values[selected]
+            return _build(rows, cols, values, shape, a.dtype)
+
+        # Other semirings join every a[i, k] with every b[k, j] in memory, so cost
+        # is count of such pairs. Rows of a without mask elements are skipped,
+        # complemented masks are applied only after the join.
+        b = b.tocsr()
+        left_rows, inner, left_values = _coo(a)
+        if mask is not None and not complement:
+            mask_rows, _, _ = _coo(mask)
+            selected = np.isin(left_rows, mask_rows)
+            left_rows, inner = left_rows[selected], inner[selected]
+            left_values = left_values[selected]
+
+        counts = b.indptr[inner + 1] - b.indptr[inner]
+        offsets = np.repeat(b.indptr[inner] - np.cumsum(counts) + counts, counts)
+        positions = np.arange(counts.sum()) + offsets
+        rows = np.repeat(left_rows, counts)
+        cols = b.indices[positions].astype(np.int64)
+        values = _MULTIPLY_OPS[multiply](
+            np.repeat(left_values, counts), b.data[positions]
+        )
+
+        if mask is not None:
+            selected = _in_mask(rows, cols, mask, complement)
+            rows, cols, values = rows[selected], cols[selected], values[selected]
+
+        return _combine(rows, cols, values.astype(a.dtype), shape, add, a.dtype)
+
+    def vxm(self, v, a, semiring: str, mask=None, complement: bool = False):
+        return self.mxm(v, a, semiring, mask=mask, complement=complement)
+
+    def eadd(self, a, b, op: str):
+        a_rows, a_cols, a_values = _coo(a)
+        b_rows, b_cols, b_values = _coo(b)
+        return _combine(
+            np.concatenate([a_rows, b_rows]),
+            np.concatenate([a_cols, b_cols]),
+            np.concatenate([a_values, b_values.astype(a.dtype)]),
+            a.shape,
+            op,
+            a.dtype,
+        )
+
+    def apply(self, a, op: str):
+        rows, cols, _ = _coo(a)
+        values = {"positioni": rows, "positionj": cols}[op]
+        return _build(rows, cols, values, a.shape, a.dtype)
+
+    def select(self, a, op: str, thunk):
+        rows, cols, values = _coo(a)
+        selected = _SELECT_OPS[op](values, thunk)
+        return _build(
+            rows[selected], cols[selected], values[selected], a.shape, a.dtype
+        )
+
+    def assign_scalar(self, a, value, mask, complement: bool = False):
+        if complement:
+            keys = np.arange(a.shape[0] * a.shape[1], dtype=np.int64)
+            mask_rows, mask_cols, _ = _coo(mask)
+            keys = keys[~np.isin(keys, _keys(mask_rows, mask_cols, a.shape[1]))]
+            mask_rows, mask_cols = np.divmod(keys, a.shape[1])
+        else:
+            mask_rows, mask_cols, _ = _coo(mask)
+
+        rows, cols, values = _coo(a)
+        return _combine(
+            np.concatenate([rows, mask_rows]),
+            np.concatenate([cols, mask_cols]),
+            np.concatenate([values, np.full(len(mask_rows), value, dtype=a.dtype)]),
+            a.shape,
+            "second",
+            a.dtype,
+        )
+
+    def reduce(self, a):
+        return a.data.sum().item()
+
+    def reduce_vector(self, a):
+        rows, _, values = _coo(a)
+        return _combine(
+            np.zeros_like(rows), rows, values, (1, a.shape[0]), "plus", a.dtype
+        )
+
+    def tril(self, a):
+        rows, cols, values = _coo(a)
+        selected = cols <= rows
+        return _build(
+            rows[selected], cols[selected], values[selected], a.shape, a.dtype
+        )
+
+    def triu(self, a):
+        rows, cols, values = _coo(a)
+        selected = cols >= rows
+        return _build(
+            rows[selected], cols[selected], values[selected], a.shape, a.dtype
+        )
+
+    def extract_row(self, a, index: int):
+        rows, cols, values = _coo(a)
+        selected = rows == index
+        return _build(
+            np.zeros(selected.sum(), dtype=np.int64),
+            cols[selected],
+            values[selected],
+            (1, a.shape[1]),
+            a.dtype,
+        )
+
+    def extract_column(self, a, index: int):
+        rows, cols, values = _coo(a)
+        selected = cols == index
+        return _build(
+            rows[selected],
+            np.zeros(selected.sum(), dtype=np.int64),
+            values[selected],
+            (a.shape[0], 1),
+            a.dtype,
+        )
+
+    def iseq(self, a, b) -> bool:
+        if a.shape != b.shape or a.nnz != b.nnz:
+            return False
+        a, b = a.tocsr(), b.tocsr()
+        a.sort_indices()
+        b.sort_indices()
+        return (
+            np.array_equal(a.indptr, b.indptr)
+            and np.array_equal(a.indices, b.indices)
+            and np.array_equal(a.data, b.data)
+        )
+
+    def to_arrays(self, a):
+        return _coo(a)
+
+    def vector_to_arrays(self, v):
+        _, indices, values = _coo(v)
+        return indices, values
+
+    def to_dense(self, a, fill=0):
+        rows, cols, values = _coo(a)
+        result = np.full(a.shape, fill, dtype=np.result_type(values, fill))
+        result[rows, cols] = values
+        return result
+
+    def vector_to_dense(self, v, fill=0):
+        return self.to_dense(v, fill)[0]
+
+
+backend = ScipyBackend()
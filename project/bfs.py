@@ -1,110 +1,161 @@
-import pygraphblas
-from pygraphblas import Matrix, types, Vector
-import pygraphblas as pgb
+import numpy as np
 
+from .backends import Backend, get_backend
 from .graph import *
+from .dense import use_dense, bfs_dense, bfs_multi_source_parents_dense
 
-__all__ = ["bfs", "bfs_multi_source_parents"]
+__all__ = [
+    "bfs",
+    "bfs_array",
+    "bfs_multi_source_parents",
+    "bfs_multi_source_parents_array",
+]
 
 
 def bfs_multi_source_parents(
-    graph: Graph, start_node_orders: list[int]
+    graph: Graph, start_node_orders: list[int], dense: bool = None, backend=None
 ) -> list[tuple[int, list[int]]]:
     """
     Make bfs on given graph with given start nodes
 
     @param graph: graph to make bfs
     @param start_node_orders: indexes of start nodes inside node list in graph
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
     @return: list, which contains info about reachability to each node from given
     """
-    if len(graph.nodes) == 0 or len(start_node_orders) == 0:
+    if start_node_orders is None or len(graph.nodes) == 0:
         return []
 
-    adj_matrix = graph.as_adjacency_matrix()
-    front = Matrix.sparse(types.INT32, len(start_node_orders), len(graph.nodes))
+    result = bfs_multi_source_parents_array(
+        graph, start_node_orders, dense=dense, backend=backend
+    )
+    return list(zip(start_node_orders, result.tolist()))
+
+
+def bfs_multi_source_parents_array(
+    graph: Graph, start_node_orders: list[int], dense: bool = None, backend=None
+) -> np.ndarray:
+    """
+    Make bfs on given graph with given start nodes
+
+    @param graph: graph to make bfs
+    @param start_node_orders: indexes of start nodes inside node list in graph, None for no start nodes
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: int32 array where row i contains parent of each node in bfs from start_node_orders[i],
+    -1 for start node and -2 for unreachable nodes
+    """
+    if start_node_orders is None:
+        start_node_orders = []
+
+    if len(graph.nodes) == 0 or len(start_node_orders) == 0:
+        return np.empty((len(start_node_orders), len(graph.nodes)), dtype=np.int32)
+
+    if use_dense(graph, dense):
+        return bfs_multi_source_parents_dense(
+            graph.as_dense_adjacency_matrix(), start_node_orders
+        )
 
-    for i in range(len(start_node_orders)):
-        front[i, start_node_orders[i]] = start_node_orders[i]
+    backend = get_backend(backend)
+    adj_matrix = graph.as_adjacency_matrix(backend=backend)
+    front = backend.matrix(
+        len(start_node_orders),
+        len(graph.nodes),
+        np.int32,
+        range(len(start_node_orders)),
+        start_node_orders,
+        start_node_orders,
+    )
 
-    result = bfs_matrix_multi_source_parents(adj_matrix, front)
-    return [
-        (start_node_orders[i], list(result[i, :].vals))
-        for i in range(len(start_node_orders))
-    ]
+    return backend.to_dense(bfs_matrix_multi_source_parents(adj_matrix, front, backend))
 
 
-def bfs(graph: Graph, start_node_order: int) -> list[int]:
+def bfs(
+    graph: Graph, start_node_order: int, dense: bool = None, backend=None
+) -> list[int]:
     """
     Make bfs on given graph with given start node
 
     @param graph: graph to make bfs
     @param start_node_order: index of start node inside node list in graph
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
     @return: list, which contains info (number of hopes need to reach) about reachability to each node from given
     """
-    if len(graph.nodes) == 0:
-        return []
+    return bfs_array(graph, start_node_order, dense=dense, backend=backend).tolist()
+
+
+def bfs_array(
+    graph: Graph, start_node_order: int, dense: bool = None, backend=None
+) -> np.ndarray:
+    """
+    Make bfs on given graph with given start node
+
+    @param graph: graph to make bfs
+    @param start_node_order: index of start node inside node list in graph
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: int32 array with number of hops to reach each node, -1 for unreachable nodes
+    """
+    if start_node_order is None or len(graph.nodes) == 0:
+        return np.full(len(graph.nodes), -1, dtype=np.int32)
 
-    if start_node_order is None:
-        return [-1] * len(graph.nodes)
+    if use_dense(graph, dense):
+        return bfs_dense(graph.as_dense_adjacency_matrix(), start_node_order)
 
-    adj_matrix = graph.as_adjacency_matrix()
+    backend = get_backend(backend)
+    adj_matrix = graph.as_adjacency_matrix(backend=backend)
 
-    front = Vector.sparse(types.BOOL, len(graph.nodes))
-    front[start_node_order] = True
-    return list(bfs_matrix(adj_matrix, front).vals)
+    front = backend.vector(len(graph.nodes), np.bool_, [start_node_order], [True])
+    return backend.vector_to_dense(bfs_matrix(adj_matrix, front, backend))
 
 
-def bfs_matrix(adj_matrix: Matrix, front: Vector) -> Vector:
+def bfs_matrix(adj_matrix, front, backend: Backend):
     """
     Make bfs on given adjacency matrix with given front
 
     @param adj_matrix: graph to make bfs
     @param front: front from which start bfs
+    @param backend: backend of given matrix and vector
     @return: list, which contains info (number of hopes need to reach) about reachability to each node from given
     """
-    result = Vector.sparse(types.INT32, front.size, fill=0, mask=front)
+    result = backend.assign_scalar(
+        backend.vector(backend.shape(adj_matrix)[1], np.int32), 0, mask=front
+    )
 
     step = 0
     while True:
         step += 1
-        front = front.vxm(
-            adj_matrix,
-            mask=result,
-            desc=pygraphblas.descriptor.S & pygraphblas.descriptor.C,
-        )
+        front = backend.vxm(front, adj_matrix, "lor_land", mask=result, complement=True)
 
-        if front.nvals == 0:
+        if backend.nvals(front) == 0:
             break
 
-        result[front] = step
+        result = backend.assign_scalar(result, step, mask=front)
 
-    result.assign_scalar(-1, mask=result, desc=pgb.descriptor.S & pgb.descriptor.C)
-    return result
+    return backend.assign_scalar(result, -1, mask=result, complement=True)
 
 
-def bfs_matrix_multi_source_parents(adj_matrix: Matrix, front: Matrix) -> Matrix:
+def bfs_matrix_multi_source_parents(adj_matrix, front, backend: Backend):
     """
     Make bfs on given adjacency matrix with given front
 
     @param adj_matrix: graph to make bfs
     @param front: front from which start bfs
+    @param backend: backend of given matrices
     @return: list, which contains info about reachability to each node from given
     """
-    result = Matrix.sparse(pgb.INT32, front.nrows, front.ncols)
-
-    result.assign_scalar(-1, mask=front, desc=pgb.descriptor.S)
-    while front.nvals > 0:
-        front.mxm(
-            adj_matrix,
-            out=front,
-            semiring=pgb.INT32.MIN_FIRST,
-            mask=result,
-            desc=pgb.descriptor.S & pgb.descriptor.RC,
-        )
-        result.eadd(front, out=result)
-        front.apply(
-            pgb.INT32.POSITIONJ,
-            out=front,
+    nrows, ncols = backend.shape(front)
+    result = backend.assign_scalar(
+        backend.matrix(nrows, ncols, np.int32), -1, mask=front
+    )
+
+    while backend.nvals(front) > 0:
+        front = backend.mxm(
+            front, adj_matrix, "min_first", mask=result, complement=True
         )
-    result.assign_scalar(-2, mask=result, desc=pgb.descriptor.S & pgb.descriptor.C)
-    return result
+        result = backend.eadd(result, front, "first")
+        front = backend.apply(front, "positionj")
+
+    return backend.assign_scalar(result, -2, mask=result, complement=True)
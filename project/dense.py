@@ -0,0 +1,209 @@
+import numpy as np
+
+from project.graph import Graph
+
+__all__ = [
+    "use_dense",
+    "bfs_dense",
+    "bfs_multi_source_parents_dense",
+    "bellman_ford_multi_source_dense",
+    "floyd_warshall_dense",
+    "triangles_count_for_each_vertex_dense",
+    "triangles_count_cohen_dense",
+    "triangles_count_sandia_dense",
+]
+
+# graphs with at most this count of nodes always use dense kernels
+TINY_GRAPH_NODES = 128
+# graphs with at most this count of nodes use dense kernels if their density
+# is at least SMALL_GRAPH_DENSITY, sparser ones do not pay for n^3 products
+SMALL_GRAPH_NODES = 1024
+SMALL_GRAPH_DENSITY = 0.01
+# bigger graphs use dense kernels only if their density is at least this value
+DENSE_GRAPH_DENSITY = 0.05
+# graphs with more nodes never use dense kernels, n x n arrays become too large
+DENSE_MAX_NODES = 4096
+# upper bound of intermediate array size in min-plus product
+MIN_PLUS_BLOCK_ELEMENTS = 1 << 24
+
+
+def use_dense(graph: Graph, dense: bool = None) -> bool:
+    """
+    Choose between dense numpy and sparse GraphBLAS kernels for given graph
+
+    @param graph: graph to run algorithm on
+    @param dense: True or False to force dense or sparse kernels, None to choose automatically
+    @return: True if dense kernels should be used
+    """
+    if dense is not None:
+        return dense
+
+    nodes_count = len(graph.nodes)
+    if nodes_count <= TINY_GRAPH_NODES:
+        return True
+    if nodes_count <= SMALL_GRAPH_NODES:
+        return graph.density >= SMALL_GRAPH_DENSITY
+    if nodes_count <= DENSE_MAX_NODES:
+        return graph.density >= DENSE_GRAPH_DENSITY
+    return False
+
+
+def bfs_dense(adj_matrix: np.ndarray, start_node: int) -> np.ndarray:
+    """
+    Make bfs on given dense adjacency matrix with given start node
+
+    @param adj_matrix: boolean adjacency matrix of graph
+    @param start_node: index of start node
+    @return: array with number of hops to reach each node, -1 for unreachable nodes
+    """
+    result = np.full(adj_matrix.shape[0], -1, dtype=np.int32)
+    front = np.zeros(adj_matrix.shape[0], dtype=bool)
+    front[start_node] = True
+    result[start_node] = 0
+
+    step = 0
+    while True:
+        step += 1
+        front = (front @ adj_matrix) & (result == -1)
+
+        if not front.any():
+            break
+
+        result[front] = step
+
+    return result
+
+
+def bfs_multi_source_parents_dense(
+    adj_matrix: np.ndarray, start_nodes: list[int]
+) -> np.ndarray:
+    """
+    Make bfs on given dense adjacency matrix with given start nodes
+
+    @param adj_matrix: boolean adjacency matrix of graph
+    @param start_nodes: indexes of start nodes
+    @return: array where row i contains parent of each node in bfs from start_nodes[i],
+    -1 for start node and -2 for unreachable nodes
+    """
+    result = np.full((len(start_nodes), adj_matrix.shape[0]), -2, dtype=np.int32)
+
+    for i, start_node in enumerate(start_nodes):
+        parents = result[i]
+        parents[start_node] = -1
+        front = np.array([start_node])
+        while front.size > 0:
+            # argmax gives first front node with edge, it is the one with minimal index
+            reachable = adj_matrix[front]
+            new_nodes = reachable.any(axis=0) & (parents == -2)
+            parents[new_nodes] = front[reachable[:, new_nodes].argmax(axis=0)]
+            front = np.flatnonzero(new_nodes)
+
+    return result
+
+
+def _min_plus(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Multiply matrices over min-plus semiring
+
+    @param left: matrix of size m x k
+    @param right: matrix of size k x n
+    @return: matrix of size m x n
+    """
+    result = np.empty((left.shape[0], right.shape[1]), dtype=np.float64)
+    block_rows = max(1, MIN_PLUS_BLOCK_ELEMENTS // max(1, right.size))
+    for row in range(0, left.shape[0], block_rows):
+        block = left[row : row + block_rows]
+        result[row : row + block_rows] = (
+            block[:, :, np.newaxis] + right[np.newaxis, :, :]
+        ).min(axis=1)
+    return result
+
+
+def bellman_ford_multi_source_dense(
+    adj_matrix: np.ndarray, start_nodes: list[int]
+) -> np.ndarray:
+    """
+    Make shortest path search with Bellman-Ford algorithm on dense matrix
+
+    @param adj_matrix: matrix of edge weights with zero diagonal and inf for absent edges
+    @param start_nodes: list of start nodes
+    @return: array where row i contains distances from start_nodes[i] to each node
+    """
+    front = np.full((len(start_nodes), adj_matrix.shape[0]), np.inf)
+    front[np.arange(len(start_nodes)), start_nodes] = 0
+
+    # one more iteration than needed to check negative weight cycles
+    for _ in range(adj_matrix.shape[0] + 1):
+        step = _min_plus(front, adj_matrix)
+        if np.array_equal(step, front):
+            return front
+        front = step
+
+    raise ValueError("Negative weight cycle detected")
+
+
+def floyd_warshall_dense(adj_matrix: np.ndarray) -> np.ndarray:
+    """
+    Make shortest path search with Floyd-Warshall algorithm on dense matrix
+
+    @param adj_matrix: matrix of edge weights with zero diagonal and inf for absent edges
+    @return: matrix of distances between each pair of nodes
+    """
+    front = adj_matrix.astype(np.float64)
+
+    for k in range(front.shape[0]):
+        np.minimum(front, front[:, k, np.newaxis] + front[np.newaxis, k, :], out=front)
+
+    if (np.diagonal(front) < 0).any():
+        raise ValueError("Negative weight cycle detected")
+
+    return front
+
+
+def _count_product(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Multiply matrices of counts with BLAS
+
+    Integer matmul in numpy does not use BLAS, float64 does and is exact
+    while counts are less than 2^53, which holds for n <= DENSE_MAX_NODES.
+
+    @param left: integer matrix
+    @param right: integer matrix
+    @return: int64 product matrix
+    """
+    product = left.astype(np.float64) @ right.astype(np.float64)
+    return np.rint(product).astype(np.int64)
+
+
+def triangles_count_for_each_vertex_dense(adj_matrix: np.ndarray) -> np.ndarray:
+    """
+    Returns count of triangles for each node
+
+    @param adj_matrix: adjacency matrix of undirected graph
+    @return: array where for each vertex computed doubled count of triangles in which this node participates
+    """
+    squared = np.where(adj_matrix != 0, _count_product(adj_matrix, adj_matrix), 0)
+    return squared.sum(axis=1)
+
+
+def triangles_count_cohen_dense(adj_matrix: np.ndarray) -> int:
+    """
+    Returns count of triangles in graph
+
+    @param adj_matrix: adjacency matrix of undirected graph
+    @return: count of triangles in graph
+    """
+    result = _count_product(np.tril(adj_matrix), np.triu(adj_matrix))
+    return int(result[adj_matrix != 0].sum()) // 2
+
+
+def triangles_count_sandia_dense(adj_matrix: np.ndarray) -> int:
+    """
+    Returns count of triangles in graph
+
+    @param adj_matrix: adjacency matrix of undirected graph
+    @return: count of triangles in graph
+    """
+    tril = np.tril(adj_matrix)
+    result = _count_product(tril, tril)
+    return int(result[tril != 0].sum())
@@ -7,7 +7,9 @@ __all__ = [
     "convert_to_weighted_graph",
 ]
 
-from pygraphblas import Matrix, types
+import numpy as np
+
+from .backends import get_backend
 
 
 class Node:
@@ -54,6 +56,21 @@ class Graph:
     def nodes(self):
         return self._nodes
 
+    @property
+    def edges(self):
+        return self._edges
+
+    @property
+    def density(self) -> float:
+        """
+        Get ratio of edges count to count of all possible edges
+
+        @return: density of adjacency matrix of graph
+        """
+        if len(self._nodes) == 0:
+            return 0.0
+        return len(self._edges) / (len(self._nodes) * len(self._nodes))
+
     def get_connected_nodes(self, node_from: any) -> set[Node]:
         """
         Get list of nodes which are reachable from given node
@@ -80,23 +97,62 @@ class Graph:
                 return i
         raise ValueError("Graph does not contain given node")
 
-    def as_adjacency_matrix(
-        self, matrix_type=types.BOOL, zero_diag: bool = False
-    ) -> Matrix:
-        adj_matrix = Matrix.sparse(matrix_type, len(self.nodes), len(self.nodes))
+    def _adjacency_entries(self, dtype, zero_diag: bool):
+        """
+        Get coordinates and values of adjacency matrix elements
+
+        @param dtype: numpy type of matrix elements, edges of bool matrix are True
+        @param zero_diag: add zeros on main diagonal
+        @return: rows, columns and values as numpy arrays
+        """
+        orders = {}
+        for i, node in enumerate(self._nodes):
+            orders.setdefault(node, i)
+
+        is_bool = np.dtype(dtype) == np.bool_
+        entries = {}
         for edge in self._edges:
             node, connected = edge.nodes
-            if matrix_type == types.BOOL:
-                adj_matrix[self.order(node), self.order(connected)] = True
-            elif matrix_type == types.INT32:
-                adj_matrix[self.order(node), self.order(connected)] = int(edge.weight)
-            else:
-                adj_matrix[self.order(node), self.order(connected)] = edge.weight
+            entries[orders[node], orders[connected]] = True if is_bool else edge.weight
 
         if zero_diag:
-            for node in self._nodes:
-                adj_matrix[self.order(node), self.order(node)] = 0
+            for i in range(len(self._nodes)):
+                entries[i, i] = 0
+
+        rows = np.array([row for row, _ in entries], dtype=np.int64)
+        cols = np.array([col for _, col in entries], dtype=np.int64)
+        return rows, cols, np.array(list(entries.values())).astype(dtype)
+
+    def as_adjacency_matrix(
+        self, matrix_type=np.bool_, zero_diag: bool = False, backend=None
+    ):
+        """
+        Build adjacency matrix of graph
 
+        @param matrix_type: numpy type of matrix elements
+        @param zero_diag: set zeros on main diagonal
+        @param backend: backend or its name, None for default one
+        @return: sparse matrix of given backend
+        """
+        rows, cols, values = self._adjacency_entries(matrix_type, zero_diag)
+        return get_backend(backend).matrix(
+            len(self._nodes), len(self._nodes), matrix_type, rows, cols, values
+        )
+
+    def as_dense_adjacency_matrix(
+        self, dtype=bool, zero_diag: bool = False, fill=0
+    ) -> np.ndarray:
+        """
+        Build adjacency matrix of graph as dense numpy array
+
+        @param dtype: numpy type of matrix elements
+        @param zero_diag: set zeros on main diagonal
+        @param fill: value of matrix elements which are not edges
+        @return: square numpy array with edge weights (True for bool dtype)
+        """
+        rows, cols, values = self._adjacency_entries(dtype, zero_diag)
+        adj_matrix = np.full((len(self._nodes), len(self._nodes)), fill, dtype=dtype)
+        adj_matrix[rows, cols] = values
         return adj_matrix
 
 
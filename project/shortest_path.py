@@ -1,104 +1,184 @@
 import math
 
-import pygraphblas as pgb
-from pygraphblas import types, Matrix
+import numpy as np
 
 from project import Graph
+from project.backends import Backend, get_backend
+from project.dense import (
+    use_dense,
+    bellman_ford_multi_source_dense,
+    floyd_warshall_dense,
+)
+
+__all__ = [
+    "bellman_ford",
+    "bellman_ford_array",
+    "bellman_ford_multi_source",
+    "bellman_ford_multi_source_array",
+    "floyd_warshall",
+    "floyd_warshall_array",
+]
+
+
+def bellman_ford(
+    graph: Graph, start_node: int, dense: bool = None, backend=None
+) -> list[int]:
+    """
+    Make shortest path search with Bellman-Ford algorithm
 
-__all__ = ["bellman_ford", "bellman_ford_multi_source", "floyd_warshall"]
+    @param graph: graph to make search
+    @param start_node: one start node
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: list of distances to each node
+    """
+    return bellman_ford_array(graph, start_node, dense=dense, backend=backend).tolist()
 
 
-def bellman_ford(graph: Graph, start_node: int) -> list[int]:
+def bellman_ford_array(
+    graph: Graph, start_node: int, dense: bool = None, backend=None
+) -> np.ndarray:
     """
     Make shortest path search with Bellman-Ford algorithm
 
     @param graph: graph to make search
     @param start_node: one start node
-    @return: list of distances to each node
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: float64 array of distances to each node, inf for unreachable nodes
     """
-    return bellman_ford_multi_source(graph, [start_node])[0][1]
+    return bellman_ford_multi_source_array(
+        graph, [start_node], dense=dense, backend=backend
+    )[0]
 
 
 def bellman_ford_multi_source(
-    graph: Graph, start_nodes: list[int]
+    graph: Graph, start_nodes: list[int], dense: bool = None, backend=None
 ) -> list[tuple[int, list[int]]]:
     """
     Make shortest path search with Bellman-Ford algorithm
 
     @param graph: graph to make search
     @param start_nodes: list of start nodes
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
     @return: list of 2-element tuples (first is node order, second is list of distances to each node)
     """
     if len(graph.nodes) == 0 or len(start_nodes) == 0:
         return []
 
-    adj_matrix = graph.as_adjacency_matrix(matrix_type=types.FP64, zero_diag=True)
-    front = Matrix.sparse(types.FP64, len(start_nodes), len(graph.nodes))
+    result = bellman_ford_multi_source_array(
+        graph, start_nodes, dense=dense, backend=backend
+    )
+    return list(zip(start_nodes, result.tolist()))
 
-    for i in range(len(start_nodes)):
-        front[i, start_nodes[i]] = 0
 
-    result = bellman_ford_multi_source_matrix(adj_matrix, front)
-
-    return [
-        (
-            start_nodes[i],
-            [
-                result.get(start_nodes[i], col, default=math.inf)
-                for col in range(len(graph.nodes))
-            ],
-        )
-        for i in range(len(start_nodes))
-    ]
+def bellman_ford_multi_source_array(
+    graph: Graph, start_nodes: list[int], dense: bool = None, backend=None
+) -> np.ndarray:
+    """
+    Make shortest path search with Bellman-Ford algorithm
 
+    @param graph: graph to make search
+    @param start_nodes: list of start nodes
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: float64 array where row i contains distances from start_nodes[i] to each node
+    """
+    if len(graph.nodes) == 0 or len(start_nodes) == 0:
+        return np.empty((len(start_nodes), len(graph.nodes)), dtype=np.float64)
 
-def bellman_ford_multi_source_matrix(graph: Matrix, front: Matrix) -> Matrix:
-    for _ in range(front.ncols):
-        front.mxm(
-            graph,
-            out=front,
-            semiring=pgb.FP64.MIN_PLUS,
+    if use_dense(graph, dense):
+        adj_matrix = graph.as_dense_adjacency_matrix(
+            dtype=np.float64, zero_diag=True, fill=math.inf
         )
+        return bellman_ford_multi_source_dense(adj_matrix, start_nodes)
+
+    backend = get_backend(backend)
+    adj_matrix = graph.as_adjacency_matrix(
+        matrix_type=np.float64, zero_diag=True, backend=backend
+    )
+    front = backend.matrix(
+        len(start_nodes),
+        len(graph.nodes),
+        np.float64,
+        range(len(start_nodes)),
+        start_nodes,
+        np.zeros(len(start_nodes)),
+    )
+
+    return backend.to_dense(
+        bellman_ford_multi_source_matrix(adj_matrix, front, backend), fill=math.inf
+    )
+
+
+def bellman_ford_multi_source_matrix(graph, front, backend: Backend):
+    # one more iteration than needed to check negative weight cycles
+    for _ in range(backend.shape(front)[1] + 1):
+        step = backend.mxm(front, graph, "min_plus")
+        if backend.iseq(step, front):
+            return front
+        front = step
+
+    raise ValueError("Negative weight cycle detected")
+
+
+def floyd_warshall(
+    graph: Graph, dense: bool = None, backend=None
+) -> list[tuple[int, list[int]]]:
+    """
+    Make shortest path search with Floyd-Warshall algorithm
 
-    if front.isne(front.mxm(graph, semiring=pgb.FP64.MIN_PLUS)):
-        raise ValueError("Negative weight cycle detected")
-
-    return front
+    @param graph: graph to make search
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: list of 2-element tuples (first is node order, second is list of distances to each node)
+    """
+    front = floyd_warshall_array(graph, dense=dense, backend=backend)
+    return list(enumerate(front.tolist()))
 
 
-def floyd_warshall(graph: Graph) -> list[tuple[int, list[int]]]:
+def floyd_warshall_array(graph: Graph, dense: bool = None, backend=None) -> np.ndarray:
     """
     Make shortest path search with Floyd-Warshall algorithm
 
     @param graph: graph to make search
-    @return: list of 2-element tuples (first is node order, second is list of distances to each node)
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: float64 array of distances between each pair of nodes, inf for unreachable ones
     """
-    adj_matrix = graph.as_adjacency_matrix(matrix_type=types.FP64, zero_diag=True)
-    front = floyd_warshall_matrix(adj_matrix)
-
-    return [
-        (
-            row,
-            [front.get(row, col, default=math.inf) for col in range(len(graph.nodes))],
+    if use_dense(graph, dense):
+        adj_matrix = graph.as_dense_adjacency_matrix(
+            dtype=np.float64, zero_diag=True, fill=math.inf
         )
-        for row in range(len(graph.nodes))
-    ]
+        return floyd_warshall_dense(adj_matrix)
+
+    backend = get_backend(backend)
+    adj_matrix = graph.as_adjacency_matrix(
+        matrix_type=np.float64, zero_diag=True, backend=backend
+    )
+    return backend.to_dense(floyd_warshall_matrix(adj_matrix, backend), fill=math.inf)
 
 
-def floyd_warshall_matrix(graph: Matrix) -> Matrix:
-    front = graph.dup()
+def floyd_warshall_matrix(graph, backend: Backend):
+    front = graph
+    size = backend.shape(graph)[1]
 
-    for k in range(graph.ncols):
-        step = front.extract_matrix(col_index=k).mxm(
-            front.extract_matrix(row_index=k), semiring=pgb.FP64.MIN_PLUS
+    for k in range(size):
+        step = backend.mxm(
+            backend.extract_column(front, k),
+            backend.extract_row(front, k),
+            "min_plus",
         )
-        front.eadd(step, add_op=pgb.FP64.MIN, out=front)
+        front = backend.eadd(front, step, "min")
 
-    for k in range(graph.ncols):
-        step = front.extract_matrix(col_index=k).mxm(
-            front.extract_matrix(row_index=k), semiring=pgb.FP64.MIN_PLUS
+    for k in range(size):
+        step = backend.mxm(
+            backend.extract_column(front, k),
+            backend.extract_row(front, k),
+            "min_plus",
         )
-        if front.isne(front.eadd(step, add_op=pgb.FP64.MIN)):
+        if not backend.iseq(front, backend.eadd(front, step, "min")):
             raise ValueError("Negative weight cycle detected")
 
     return front
@@ -1,91 +1,220 @@
-from pygraphblas import Matrix, Vector, types
+import numpy as np
 
 from project import Graph
-
-import pygraphblas as pgb
+from project.backends import Backend, get_backend
+from project.dense import (
+    use_dense,
+    triangles_count_for_each_vertex_dense,
+    triangles_count_cohen_dense,
+    triangles_count_sandia_dense,
+)
 
 __all__ = [
     "triangles_count_cohen",
     "triangles_count_sandia",
     "triangles_count_for_each_vertex",
+    "triangles_count_for_each_vertex_array",
+    "local_clustering_coefficient",
+    "local_clustering_coefficient_array",
+    "global_clustering_coefficient",
 ]
 
 
-def triangles_count_for_each_vertex(graph: Graph) -> list[int]:
+def triangles_count_for_each_vertex(
+    graph: Graph, dense: bool = None, backend=None
+) -> list[int]:
     """
     Returns count of triangles for each node
 
     @param graph: graph to compute count of triangles
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
     @return: list where for each vertex computed count of triangles in which this node participates
     """
+    return triangles_count_for_each_vertex_array(
+        graph, dense=dense, backend=backend
+    ).tolist()
+
+
+def triangles_count_for_each_vertex_array(
+    graph: Graph, dense: bool = None, backend=None
+) -> np.ndarray:
+    """
+    Returns count of triangles for each node
+
+    @param graph: graph to compute count of triangles
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: int64 array where for each vertex computed count of triangles in which this node participates
+    """
     if len(graph.nodes) == 0:
-        return []
+        return np.empty(0, dtype=np.int64)
+
+    if use_dense(graph, dense):
+        adj_matrix = graph.as_dense_adjacency_matrix(dtype=np.int32)
+        return triangles_count_for_each_vertex_dense(adj_matrix) // 2
 
-    adj_matrix = graph.as_adjacency_matrix(matrix_type=types.INT32)
-    result_vector = triangles_count_for_each_vertex_matrix(adj_matrix)
+    backend = get_backend(backend)
+    adj_matrix = graph.as_adjacency_matrix(matrix_type=np.int32, backend=backend)
+    result_vector = triangles_count_for_each_vertex_matrix(adj_matrix, backend)
 
-    return [result_vector.get(i, default=0) // 2 for i in range(result_vector.size)]
+    return backend.vector_to_dense(result_vector).astype(np.int64) // 2
 
 
-def triangles_count_for_each_vertex_matrix(graph: Matrix) -> Vector:
+def triangles_count_for_each_vertex_matrix(graph, backend: Backend):
     """
     Returns count of triangles for each node
 
     @param graph: adjacency matrix of graph to compute count of triangles
+    @param backend: backend of given matrix
     @return: vector where for each vertex computed count of triangles in which this node participates
     """
-    squared = graph.mxm(graph, mask=graph, desc=pgb.descriptor.S)
+    result = backend.reduce_vector(triangles_support_matrix(graph, backend))
+    return result
+
+
+def triangles_support_matrix(graph, backend: Backend):
+    """
+    Returns count of triangles for each edge
+
+    @param graph: adjacency matrix of undirected graph with ones as values
+    @param backend: backend of given matrix
+    @return: matrix where each edge which is in some triangle holds count of such triangles
+    """
+    return backend.mxm(graph, graph, "plus_times", mask=graph)
+
+
+def local_clustering_coefficient(
+    graph: Graph, dense: bool = None, backend=None
+) -> list[float]:
+    """
+    Returns local clustering coefficient for each node
 
-    result = squared.reduce_vector()
+    @param graph: undirected graph without self loops
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: list where for each vertex computed share of connected pairs among its neighbours
+    """
+    return local_clustering_coefficient_array(
+        graph, dense=dense, backend=backend
+    ).tolist()
+
+
+def local_clustering_coefficient_array(
+    graph: Graph, dense: bool = None, backend=None
+) -> np.ndarray:
+    """
+    Returns local clustering coefficient for each node
+
+    @param graph: undirected graph without self loops
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: float64 array where for each vertex computed share of connected pairs among its neighbours
+    """
+    triangles, triplets = _triangles_and_triplets(graph, dense, backend)
+    result = np.zeros(len(graph.nodes), dtype=np.float64)
+    np.divide(triangles, triplets, out=result, where=triplets > 0)
     return result
 
 
-def triangles_count_cohen(graph: Graph) -> int:
+def global_clustering_coefficient(
+    graph: Graph, dense: bool = None, backend=None
+) -> float:
+    """
+    Returns global clustering coefficient (transitivity) of graph
+
+    @param graph: undirected graph without self loops
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: share of closed triplets among all triplets of graph
+    """
+    triangles, triplets = _triangles_and_triplets(graph, dense, backend)
+    if triplets.sum() == 0:
+        return 0.0
+    return float(triangles.sum() / triplets.sum())
+
+
+def _triangles_and_triplets(graph: Graph, dense: bool, backend):
+    """
+    Returns count of triangles and count of pairs of neighbours for each node
+
+    @param graph: undirected graph without self loops
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
+    @return: two int64 arrays
+    """
+    triangles = triangles_count_for_each_vertex_array(
+        graph, dense=dense, backend=backend
+    )
+    rows, _, _ = graph._adjacency_entries(np.bool_, zero_diag=False)
+    degrees = np.bincount(rows, minlength=len(graph.nodes)).astype(np.int64)
+    return triangles, degrees * (degrees - 1) // 2
+
+
+def triangles_count_cohen(graph: Graph, dense: bool = None, backend=None) -> int:
     """
     Returns count of triangles in graph
 
     @param graph: graph to compute count of triangles
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
     @return: count of triangles in graph
     """
     if len(graph.nodes) == 0:
         return 0
 
-    adj_matrix = graph.as_adjacency_matrix(matrix_type=types.INT32)
-    return triangles_count_cohen_matrix(adj_matrix)
+    if use_dense(graph, dense):
+        adj_matrix = graph.as_dense_adjacency_matrix(dtype=np.int32)
+        return triangles_count_cohen_dense(adj_matrix)
 
+    backend = get_backend(backend)
+    adj_matrix = graph.as_adjacency_matrix(matrix_type=np.int32, backend=backend)
+    return triangles_count_cohen_matrix(adj_matrix, backend)
 
-def triangles_count_cohen_matrix(graph: Matrix) -> int:
+
+def triangles_count_cohen_matrix(graph, backend: Backend) -> int:
     """
     Returns count of triangles in graph
 
     @param graph: adjacency matrix of graph to compute count of triangles
+    @param backend: backend of given matrix
     @return: count of triangles in graph
     """
-    result = graph.tril().mxm(graph.triu(), mask=graph, desc=pgb.descriptor.S)
-    return result.reduce() // 2
+    result = backend.mxm(
+        backend.tril(graph), backend.triu(graph), "plus_times", mask=graph
+    )
+    return backend.reduce(result) // 2
 
 
-def triangles_count_sandia(graph: Graph) -> int:
+def triangles_count_sandia(graph: Graph, dense: bool = None, backend=None) -> int:
     """
     Returns count of triangles in graph
 
     @param graph: graph to compute count of triangles
+    @param dense: force dense (True) or sparse (False) kernel, None to choose by graph size and density
+    @param backend: backend of sparse kernel or its name, None for default one
     @return: count of triangles in graph
     """
     if len(graph.nodes) == 0:
         return 0
 
-    adj_matrix = graph.as_adjacency_matrix(matrix_type=types.INT32)
-    return triangles_count_sandia_matrix(adj_matrix)
+    if use_dense(graph, dense):
+        adj_matrix = graph.as_dense_adjacency_matrix(dtype=np.int32)
+        return triangles_count_sandia_dense(adj_matrix)
+
+    backend = get_backend(backend)
+    adj_matrix = graph.as_adjacency_matrix(matrix_type=np.int32, backend=backend)
+    return triangles_count_sandia_matrix(adj_matrix, backend)
 
 
-def triangles_count_sandia_matrix(graph: Matrix) -> int:
+def triangles_count_sandia_matrix(graph, backend: Backend) -> int:
     """
     Returns count of triangles in graph
 
     @param graph: adjacency matrix of graph to compute count of triangles
+    @param backend: backend of given matrix
     @return: count of triangles in graph
     """
-    tril = graph.tril()
-    result = tril.mxm(tril, mask=tril, desc=pgb.descriptor.S)
-    return result.reduce()
+    tril = backend.tril(graph)
+    result = backend.mxm(tril, tril, "plus_times", mask=tril)
+    return backend.reduce(result)
@@ -0,0 +1,135 @@
+import numpy as np
+
+from project import Graph
+from project.backends import Backend, get_backend
+from project.triangles import triangles_support_matrix
+
+__all__ = [
+    "k_truss",
+    "k_truss_array",
+    "truss_decomposition",
+    "truss_decomposition_array",
+]
+
+
+def k_truss(graph: Graph, k: int, backend=None) -> list[tuple[int, int]]:
+    """
+    Find edges of k-truss: maximal subgraph where each edge is in at least k - 2 triangles
+
+    @param graph: undirected graph without self loops
+    @param k: order of truss, at least 3
+    @param backend: backend or its name, None for default one
+    @return: list of edges (pairs of node orders, first is smaller) sorted by first and second node
+    """
+    return [tuple(edge) for edge in k_truss_array(graph, k, backend=backend).tolist()]
+
+
+def k_truss_array(graph: Graph, k: int, backend=None) -> np.ndarray:
+    """
+    Find edges of k-truss: maximal subgraph where each edge is in at least k - 2 triangles
+
+    @param graph: undirected graph without self loops
+    @param k: order of truss, at least 3
+    @param backend: backend or its name, None for default one
+    @return: int64 array of shape (count of edges, 2) with node orders, first is smaller
+    """
+    if len(graph.nodes) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    backend = get_backend(backend)
+    support, _ = k_truss_matrix(_support_matrix(graph, backend), k, backend)
+    rows, cols, _ = _upper_edges(support, backend)
+    return np.stack([rows, cols], axis=1)
+
+
+def truss_decomposition(graph: Graph, backend=None) -> list[tuple[int, int, int]]:
+    """
+    Find truss number of each edge: maximal k such that edge is in k-truss
+
+    @param graph: undirected graph without self loops
+    @param backend: backend or its name, None for default one
+    @return: list of triples (two node orders, first is smaller, and truss number)
+    """
+    return [tuple(edge) for edge in truss_decomposition_array(graph, backend).tolist()]
+
+
+def truss_decomposition_array(graph: Graph, backend=None) -> np.ndarray:
+    """
+    Find truss number of each edge: maximal k such that edge is in k-truss
+
+    @param graph: undirected graph without self loops
+    @param backend: backend or its name, None for default one
+    @return: int64 array of shape (count of edges, 3) with two node orders and truss number
+    """
+    if len(graph.nodes) == 0:
+        return np.empty((0, 3), dtype=np.int64)
+
+    backend = get_backend(backend)
+    support = _support_matrix(graph, backend)
+    truss = backend.matrix(len(graph.nodes), len(graph.nodes), np.int32)
+
+    # support left after peeling k-truss is support of (k + 1)-truss peeling
+    k = 3
+    while backend.nvals(support) > 0:
+        support, peeled = k_truss_matrix(support, k, backend)
+        truss = backend.eadd(
+            truss, backend.assign_scalar(peeled, k - 1, mask=peeled), "first"
+        )
+        k += 1
+
+    rows, cols, values = _upper_edges(truss, backend)
+    return np.stack([rows, cols, values], axis=1)
+
+
+def k_truss_matrix(support, k: int, backend: Backend):
+    """
+    Peel edges which are in less than k - 2 triangles until there are no such edges
+
+    Support is not recomputed: on each pass triangles lost by remaining edges
+    are computed with masked products over removed edges and subtracted.
+
+    @param support: matrix with count of triangles for each edge, zero for edges without triangles
+    @param k: order of truss
+    @param backend: backend of given matrix
+    @return: support matrix of k-truss and matrix of peeled edges
+    """
+    nrows, ncols = backend.shape(support)
+    peeled = backend.matrix(nrows, ncols, np.int32)
+
+    while True:
+        removed = backend.select(support, "<", k - 2)
+        if backend.nvals(removed) == 0:
+            return support, peeled
+
+        # C * C - C' * C' = C * R + R * C' where C = C' + R
+        old = support
+        support = backend.select(support, ">=", k - 2)
+        lost = backend.eadd(
+            backend.mxm(old, removed, "plus_pair", mask=support),
+            backend.mxm(removed, support, "plus_pair", mask=support),
+            "plus",
+        )
+        support = backend.eadd(support, lost, "minus")
+        peeled = backend.eadd(peeled, removed, "first")
+
+
+def _support_matrix(graph: Graph, backend: Backend):
+    """
+    Build support matrix which also holds zeros for edges without triangles
+    """
+    adj_matrix = graph.as_adjacency_matrix(matrix_type=np.int32, backend=backend)
+    edges = backend.assign_scalar(adj_matrix, 0, mask=adj_matrix)
+    return backend.eadd(triangles_support_matrix(adj_matrix, backend), edges, "first")
+
+
+def _upper_edges(a, backend: Backend):
+    """
+    Export elements of symmetric matrix above main diagonal sorted by row and column
+    """
+    rows, cols, values = (
+        np.asarray(array, dtype=np.int64) for array in backend.to_arrays(a)
+    )
+    upper = rows < cols
+    rows, cols, values = rows[upper], cols[upper], values[upper]
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order], values[order]
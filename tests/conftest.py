@@ -0,0 +1,15 @@
+import pytest
+
+kernels = [
+    {"dense": True},
+    {"dense": False, "backend": "pygraphblas"},
+    {"dense": False, "backend": "scipy"},
+]
+
+
+@pytest.fixture(params=kernels, ids=["dense", "pygraphblas", "scipy"])
+def kernel(request) -> dict:
+    """
+    Keyword arguments of algorithm which select its implementation
+    """
+    return request.param
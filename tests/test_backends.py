@@ -0,0 +1,100 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from project.backends import BACKEND_ENV_VAR, Backend, get_backend
+
+
+def test_backend_by_name():
+    assert get_backend("scipy").name == "scipy"
+
+
+def test_backend_object():
+    backend = get_backend("scipy")
+    assert get_backend(backend) is backend
+
+
+def test_backend_from_environment(monkeypatch):
+    monkeypatch.setenv(BACKEND_ENV_VAR, "scipy")
+    assert get_backend().name == "scipy"
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_backend("unknown")
+
+
+def test_incomplete_backend():
+    class IncompleteBackend(Backend):
+        def matrix(self, nrows, ncols, dtype, rows=(), cols=(), values=()):
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+def test_lazy_import():
+    code = (
+        "import sys\n"
+        "import project\n"
+        "graph = project.convert_to_graph([0, 1], [(0, 1)])\n"
+        "graph.as_adjacency_matrix(backend='scipy')\n"
+        "assert 'pygraphblas' not in sys.modules\n"
+        "assert 'suitesparse_graphblas' not in sys.modules\n"
+    )
+    root = Path(__file__).parent.parent
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+testdata = [
+    (np.bool_, [True, True]),
+    (np.int32, [3, -1]),
+    (np.int64, [3, -1]),
+    (np.float64, [0.5, -1.5]),
+]
+
+
+@pytest.mark.parametrize("backend", ["pygraphblas", "scipy"])
+@pytest.mark.parametrize("dtype,values", testdata)
+def test_to_arrays(backend, dtype, values):
+    backend = get_backend(backend)
+    a = backend.matrix(3, 3, dtype, np.array([2, 0]), np.array([1, 2]), values)
+    rows, cols, result = (np.asarray(array) for array in backend.to_arrays(a))
+    order = np.lexsort((cols, rows))
+    assert result.dtype == dtype
+    assert rows[order].tolist() == [0, 2]
+    assert cols[order].tolist() == [2, 1]
+    assert result[order].tolist() == values[::-1]
+
+
+@pytest.mark.parametrize("backend", ["pygraphblas", "scipy"])
+@pytest.mark.parametrize("dtype,values", testdata)
+def test_vector_to_arrays(backend, dtype, values):
+    backend = get_backend(backend)
+    v = backend.vector(4, dtype, np.array([3, 1]), values)
+    indices, result = (np.asarray(array) for array in backend.vector_to_arrays(v))
+    order = np.argsort(indices)
+    assert result.dtype == dtype
+    assert indices[order].tolist() == [1, 3]
+    assert result[order].tolist() == values[::-1]
+
+
+@pytest.mark.parametrize("backend", ["pygraphblas", "scipy"])
+def test_empty_matrix(backend):
+    backend = get_backend(backend)
+    a = backend.matrix(0, 0, np.int32)
+    assert backend.shape(a) == (0, 0)
+    assert backend.nvals(a) == 0
+
+
+@pytest.mark.parametrize("backend", ["pygraphblas", "scipy"])
+def test_stored_zeros(backend):
+    backend = get_backend(backend)
+    a = backend.matrix(2, 2, np.int32, np.array([0, 1]), np.array([1, 0]), [0, 2])
+    b = backend.matrix(2, 2, np.int32, np.array([1]), np.array([0]), [2])
+    assert backend.nvals(backend.select(a, "<", 1)) == 1
+    difference = backend.eadd(a, b, "minus")
+    assert backend.to_dense(difference, fill=-1).tolist() == [[-1, 0], [0, -1]]
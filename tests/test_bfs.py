@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from project import Graph, convert_to_graph, bfs
+from project import Graph, convert_to_graph, bfs, bfs_array
 
 testdata = [
     ("Linear graph", convert_to_graph([0, 1, 2], [(0, 1), (1, 2)]), 0, [0, 1, 2]),
@@ -42,6 +43,13 @@ testdata = [
 
 
 @pytest.mark.parametrize("name, graph, start_node, expected", testdata)
-def test_bfs(name: str, graph: Graph, start_node: int, expected: list[int]):
-    actual = bfs(graph, start_node)
+def test_bfs(name: str, graph: Graph, start_node: int, expected: list[int], kernel: dict):
+    actual = bfs(graph, start_node, **kernel)
     assert actual == expected
+
+
+@pytest.mark.parametrize("name, graph, start_node, expected", testdata)
+def test_bfs_array(name: str, graph: Graph, start_node: int, expected: list[int], kernel: dict):
+    actual = bfs_array(graph, start_node, **kernel)
+    assert actual.dtype == np.int32
+    assert actual.tolist() == expected
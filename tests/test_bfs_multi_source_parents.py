@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from project import Graph, convert_to_graph, bfs_multi_source_parents
+from project import Graph, convert_to_graph, bfs_multi_source_parents, bfs_multi_source_parents_array
 
 testdata = [
     ("Linear graph", convert_to_graph([0, 1, 2], [(0, 1), (1, 2)]), [0], [(0, [-1, 0, 1])]),
@@ -48,6 +49,17 @@ testdata = [
 
 
 @pytest.mark.parametrize("name, graph, start_nodes, expected", testdata)
-def test_bfs_multi_source_parents(name: str, graph: Graph, start_nodes: list[int], expected: list[int]):
-    actual = bfs_multi_source_parents(graph, start_nodes)
+def test_bfs_multi_source_parents(
+    name: str, graph: Graph, start_nodes: list[int], expected: list[int], kernel: dict
+):
+    actual = bfs_multi_source_parents(graph, start_nodes, **kernel)
     assert actual == expected
+
+
+@pytest.mark.parametrize("name, graph, start_nodes, expected", testdata)
+def test_bfs_multi_source_parents_array(
+    name: str, graph: Graph, start_nodes: list[int], expected: list[int], kernel: dict
+):
+    actual = bfs_multi_source_parents_array(graph, start_nodes, **kernel)
+    assert actual.dtype == np.int32
+    assert actual.tolist() == [parents for (_, parents) in expected]
@@ -0,0 +1,33 @@
+import pytest
+
+from project import Graph, convert_to_graph
+from project.dense import use_dense, DENSE_MAX_NODES, SMALL_GRAPH_NODES, TINY_GRAPH_NODES
+
+testdata = [
+    ("Small graph", convert_to_graph([0, 1, 2], [(0, 1)]), None, True),
+    ("Force sparse on small graph", convert_to_graph([0, 1, 2], [(0, 1)]), False, False),
+    ("Small sparse graph", Graph(list(range(TINY_GRAPH_NODES + 1)), []), None, False),
+    (
+        "Big sparse graph",
+        convert_to_graph(list(range(SMALL_GRAPH_NODES + 1)), [(0, 1)]),
+        None,
+        False,
+    ),
+    (
+        "Force dense on big sparse graph",
+        convert_to_graph(list(range(SMALL_GRAPH_NODES + 1)), [(0, 1)]),
+        True,
+        True,
+    ),
+    (
+        "Too big graph",
+        Graph(list(range(DENSE_MAX_NODES + 1)), []),
+        None,
+        False,
+    ),
+]
+
+
+@pytest.mark.parametrize("name, graph, dense, expected", testdata)
+def test_use_dense(name: str, graph: Graph, dense: bool, expected: bool):
+    assert use_dense(graph, dense) == expected
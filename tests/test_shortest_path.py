@@ -1,10 +1,16 @@
 import math
 
+import numpy as np
 import pytest
 
 from project import Graph
 from project.graph import convert_to_weighted_graph
-from project.shortest_path import bellman_ford_multi_source, floyd_warshall
+from project.shortest_path import (
+    bellman_ford_multi_source,
+    bellman_ford_multi_source_array,
+    floyd_warshall,
+    floyd_warshall_array,
+)
 
 testdata = [
     ("Linear graph", convert_to_weighted_graph([0, 1, 2], [(0, 1.0, 1), (1, 1.0, 2)]), [0], [(0, [0.0, 1.0, 2.0])]),
@@ -50,14 +56,37 @@ testdata = [
 
 
 @pytest.mark.parametrize("name, graph, start_nodes, expected", testdata)
-def test_bellman_ford(name: str, graph: Graph, start_nodes: list[int], expected: list[tuple[int, list[int]]]):
-    actual = bellman_ford_multi_source(graph, start_nodes)
+def test_bellman_ford(
+    name: str, graph: Graph, start_nodes: list[int], expected: list[tuple[int, list[int]]], kernel: dict
+):
+    actual = bellman_ford_multi_source(graph, start_nodes, **kernel)
     assert actual == expected
 
 
 @pytest.mark.parametrize("name, graph, start_nodes, expected", testdata)
-def test_floyd_warshall(name: str, graph: Graph, start_nodes: list[int], expected: list[tuple[int, list[int]]]):
-    actual = floyd_warshall(graph)
+def test_floyd_warshall(
+    name: str, graph: Graph, start_nodes: list[int], expected: list[tuple[int, list[int]]], kernel: dict
+):
+    actual = floyd_warshall(graph, **kernel)
     for (node, actual_answer) in expected:
         expected_answer = actual[node]
         assert actual_answer == expected_answer[1]
+
+
+@pytest.mark.parametrize("name, graph, start_nodes, expected", testdata)
+def test_bellman_ford_array(
+    name: str, graph: Graph, start_nodes: list[int], expected: list[tuple[int, list[int]]], kernel: dict
+):
+    actual = bellman_ford_multi_source_array(graph, start_nodes, **kernel)
+    assert actual.dtype == np.float64
+    assert actual.tolist() == [distances for (_, distances) in expected]
+
+
+@pytest.mark.parametrize("name, graph, start_nodes, expected", testdata)
+def test_floyd_warshall_array(
+    name: str, graph: Graph, start_nodes: list[int], expected: list[tuple[int, list[int]]], kernel: dict
+):
+    actual = floyd_warshall_array(graph, **kernel)
+    assert actual.dtype == np.float64
+    for (node, distances) in expected:
+        assert actual[node].tolist() == distances
@@ -1,7 +1,15 @@
+import numpy as np
 import pytest
 
 from project import Graph, convert_to_undirected_graph
-from project.triangles import triangles_count_for_each_vertex, triangles_count_cohen, triangles_count_sandia
+from project.triangles import (
+    triangles_count_for_each_vertex,
+    triangles_count_for_each_vertex_array,
+    triangles_count_cohen,
+    triangles_count_sandia,
+    local_clustering_coefficient,
+    global_clustering_coefficient,
+)
 
 testdata = [
     ("Linear graph", convert_to_undirected_graph([0, 1, 2], [(0, 1), (1, 2)]), [0, 0, 0]),
@@ -37,15 +45,55 @@ testdata = [
 
 
 @pytest.mark.parametrize("name, graph, triangles_count", testdata)
-def test_triangles_count_for_each_vertex(name: str, graph: Graph, triangles_count: list[int]):
-    assert triangles_count_for_each_vertex(graph) == triangles_count
+def test_triangles_count_for_each_vertex(name: str, graph: Graph, triangles_count: list[int], kernel: dict):
+    assert triangles_count_for_each_vertex(graph, **kernel) == triangles_count
 
 
 @pytest.mark.parametrize("name, graph, triangles_count", testdata)
-def test_triangles_count_cohen(name: str, graph: Graph, triangles_count: list[int]):
-    assert triangles_count_cohen(graph) == sum(triangles_count) // 3
+def test_triangles_count_cohen(name: str, graph: Graph, triangles_count: list[int], kernel: dict):
+    assert triangles_count_cohen(graph, **kernel) == sum(triangles_count) // 3
 
 
 @pytest.mark.parametrize("name, graph, triangles_count", testdata)
-def test_triangles_count_cohen(name: str, graph: Graph, triangles_count: list[int]):
-    assert triangles_count_sandia(graph) == sum(triangles_count) // 3
+def test_triangles_count_sandia(name: str, graph: Graph, triangles_count: list[int], kernel: dict):
+    assert triangles_count_sandia(graph, **kernel) == sum(triangles_count) // 3
+
+
+@pytest.mark.parametrize("name, graph, triangles_count", testdata)
+def test_triangles_count_for_each_vertex_array(name: str, graph: Graph, triangles_count: list[int], kernel: dict):
+    actual = triangles_count_for_each_vertex_array(graph, **kernel)
+    assert actual.dtype == np.int64
+    assert actual.tolist() == triangles_count
+
+
+clustering_testdata = [
+    ("Linear graph", convert_to_undirected_graph([0, 1, 2], [(0, 1), (1, 2)]), [0.0, 0.0, 0.0], 0.0),
+    (
+        "Graph with 1 cycle and 3 nodes",
+        convert_to_undirected_graph([0, 1, 2], [(0, 1), (1, 2), (0, 2)]),
+        [1.0, 1.0, 1.0],
+        1.0,
+    ),
+    ("Graph without edges", convert_to_undirected_graph([0, 1, 2], []), [0.0, 0.0, 0.0], 0.0),
+    ("Empty graph", convert_to_undirected_graph([], []), [], 0.0),
+    (
+        "Big graph",
+        testdata[4][1],
+        [1.0, 1 / 2, 2 / 3, 2 / 5, 1 / 3, 1 / 3, 1 / 2],
+        15 / 32,
+    ),
+]
+
+
+@pytest.mark.parametrize("name, graph, local, transitivity", clustering_testdata)
+def test_local_clustering_coefficient(
+    name: str, graph: Graph, local: list[float], transitivity: float, kernel: dict
+):
+    assert local_clustering_coefficient(graph, **kernel) == pytest.approx(local)
+
+
+@pytest.mark.parametrize("name, graph, local, transitivity", clustering_testdata)
+def test_global_clustering_coefficient(
+    name: str, graph: Graph, local: list[float], transitivity: float, kernel: dict
+):
+    assert global_clustering_coefficient(graph, **kernel) == pytest.approx(transitivity)
@@ -0,0 +1,84 @@
+import pytest
+
+from project import Graph, convert_to_undirected_graph
+from project.truss import k_truss, truss_decomposition
+
+backends = ["pygraphblas", "scipy"]
+
+testdata = [
+    ("Empty graph", convert_to_undirected_graph([], []), []),
+    ("Linear graph", convert_to_undirected_graph([0, 1, 2], [(0, 1), (1, 2)]), [(0, 1, 2), (1, 2, 2)]),
+    (
+        "Graph with 1 cycle and 3 nodes",
+        convert_to_undirected_graph([0, 1, 2], [(0, 1), (1, 2), (0, 2)]),
+        [(0, 1, 3), (0, 2, 3), (1, 2, 3)],
+    ),
+    (
+        "Clique with tail",
+        convert_to_undirected_graph(
+            [0, 1, 2, 3, 4],
+            [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3), (3, 4)],
+        ),
+        [(0, 1, 4), (0, 2, 4), (0, 3, 4), (1, 2, 4), (1, 3, 4), (2, 3, 4), (3, 4, 2)],
+    ),
+    (
+        "Diamond",
+        convert_to_undirected_graph([0, 1, 2, 3], [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)]),
+        [(0, 1, 3), (0, 2, 3), (1, 2, 3), (1, 3, 3), (2, 3, 3)],
+    ),
+    (
+        "Triangles joined by edge",
+        convert_to_undirected_graph(
+            [0, 1, 2, 3, 4, 5],
+            [(0, 1), (0, 2), (1, 2), (2, 3), (3, 4), (3, 5), (4, 5)],
+        ),
+        [(0, 1, 3), (0, 2, 3), (1, 2, 3), (2, 3, 2), (3, 4, 3), (3, 5, 3), (4, 5, 3)],
+    ),
+    (
+        "Big graph",
+        convert_to_undirected_graph(
+            [0, 1, 2, 3, 4, 5, 6],
+            [
+                (0, 1),
+                (0, 3),
+                (1, 3),
+                (1, 4),
+                (1, 6),
+                (2, 3),
+                (2, 5),
+                (2, 6),
+                (3, 5),
+                (3, 6),
+                (4, 5),
+                (4, 6),
+            ]
+        ),
+        [
+            (0, 1, 3),
+            (0, 3, 3),
+            (1, 3, 3),
+            (1, 4, 3),
+            (1, 6, 3),
+            (2, 3, 3),
+            (2, 5, 3),
+            (2, 6, 3),
+            (3, 5, 3),
+            (3, 6, 3),
+            (4, 5, 2),
+            (4, 6, 3),
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("name, graph, expected", testdata)
+def test_truss_decomposition(name: str, graph: Graph, expected: list[tuple[int, int, int]], backend: str):
+    assert truss_decomposition(graph, backend=backend) == expected
+
+
+@pytest.mark.parametrize("k", [3, 4, 5])
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("name, graph, expected", testdata)
+def test_k_truss(name: str, graph: Graph, expected: list[tuple[int, int, int]], backend: str, k: int):
+    assert k_truss(graph, k, backend=backend) == [(i, j) for (i, j, truss) in expected if truss >= k]